@@ -1,23 +1,160 @@
 import random
+import sys
 import textwrap
+import zlib
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 
-def wrap(text: str, width: int = 88) -> str:
-    return "\n".join(textwrap.fill(line, width=width) for line in text.splitlines())
+_SECRET = "whisper"  # compared against lowercased input, so keep it lowercase
+
+TAG_HIDDEN = 1
+TAG_ENDING = 2
+TAG_HOPEFUL = 4
+TAG_TRAGIC = 8
+TAG_TWIST = 16
+
+_ENDING_STYLES: Tuple[str, ...] = ("hopeful", "twist", "tragic")
+
+_STYLE_TAGS: Dict[str, int] = {
+    "hopeful": TAG_HOPEFUL,
+    "tragic": TAG_TRAGIC,
+    "twist": TAG_TWIST,
+}
+
+_WRAPPERS: Dict[int, textwrap.TextWrapper] = {}
 
 
-@dataclass
+def wrap(text: str, width: int = 88) -> str:
+    wrapper = _WRAPPERS.get(width)
+    if wrapper is None:
+        wrapper = _WRAPPERS[width] = textwrap.TextWrapper(width=width)
+    return "\n".join(wrapper.fill(line) for line in text.splitlines())
+
+
+_MOTIFS: Dict[str, Tuple[str, ...]] = {
+    "fantasy": (
+        "ancient forests hum with latent magic",
+        "ruins dream beneath ivy and star-shards",
+        "dragons are rumors woven into lullabies",
+    ),
+    "sci-fi": (
+        "neon skylines flicker over rusted megastructures",
+        "fractured moons glow above orbital shipyards",
+        "synthetic dawns reboot forgotten cities",
+    ),
+    "mystery": (
+        "fog erases footprints faster than they form",
+        "clocks tick out-of-sync with the heart",
+        "every window watches with a different story",
+    ),
+}
+
+_GENRE_KEYS: Dict[str, str] = {genre[:3]: genre for genre in _MOTIFS}
+
+_INCIDENTS: Tuple[str, ...] = (
+    "A comet carves a silent arc and leaves a whispering tail.",
+    "A letter arrives signed by a future version of you.",
+    "The river flows backward for exactly one minute.",
+    "A bell rings where there is no bell.",
+)
+
+_CLUES: Tuple[str, ...] = (
+    "a rune repeating the shape of your heartbeat",
+    "ash arranged like a compass pointing underground",
+    "a soft tone audible only when eyes are closed",
+    "footprints that avoid every puddle",
+)
+
+_FIRST_NAMES: Tuple[str, ...] = ("Iria", "Thorne", "Vel", "Mara", "Kade", "Nyx", "Quen")
+_LAST_NAMES: Tuple[str, ...] = ("Ashfall", "Kestrel", "Voss", "Hallow", "Strand", "Noct")
+
+_TERRAINS: Tuple[str, ...] = (
+    "wind-scoured valley",
+    "tangle of luminous reeds",
+    "labyrinth of basalt spires",
+    "glimmering salt flats",
+)
+
+_FORCES: Tuple[str, ...] = (
+    "the Archivist who edits memories",
+    "the Clock that refuses to strike midnight",
+    "the Leviathan beneath the city",
+    "the Choir of Masks that speaks as one",
+)
+
+_ENDING_FRAGMENTS: Dict[str, str] = {
+    "hopeful": (
+        "Kindness accumulates like dawn. Promises once broken are rewoven, and the "
+        "road ahead gleams with possibility."
+    ),
+    "tragic": (
+        "A necessary loss settles like snow. What is saved endures because of what "
+        "was given up."
+    ),
+    "twist": (
+        "Nothing was as it seemed: the question mattered more than the answer, and "
+        "the answer changes when observed."
+    ),
+}
+
+_OPENING_CHOICES: Tuple[Tuple[str, str, str], ...] = (
+    ("A", "Investigate the omen", "omen"),
+    ("B", "Seek an ally in the nearest settlement", "ally"),
+    ("C", "Ignore it and press onward", "onward"),
+)
+
+_OMEN_CHOICES: Tuple[Tuple[str, str, str], ...] = (
+    ("A", "Study the runes closely", "study_runes"),
+    ("B", "Mark the site and retreat for now", "retreat"),
+    ("C", "Touch the brightest rune", "touch_rune"),
+)
+
+_STUDY_RUNES_CHOICES: Tuple[Tuple[str, str, str], ...] = (
+    ("A", "Follow the glowing path", "hidden_path"),
+    ("B", "Copy the runes for later study", "onward"),
+    ("C", "Erase one and see what happens", "climax"),
+)
+
+_ALLY_CHOICES: Tuple[Tuple[str, str, str], ...] = (
+    ("A", "Barter a keepsake for their map", "get_map"),
+    ("B", "Earn trust by helping with a local problem", "help_local"),
+    ("C", "Refuse and chart your own route", "onward"),
+)
+
+_ONWARD_CHOICES: Tuple[Tuple[str, str, str], ...] = (
+    ("A", "Search the area for a fitting object", "search_area"),
+    ("B", "Force your way through the arch", "force_arch"),
+    ("C", "Set camp and wait for signs", "make_camp"),
+)
+
+_HIDDEN_PATH_CHOICES: Tuple[Tuple[str, str, str], ...] = (
+    ("A", "Enter the hidden passage", "hidden_depths"),
+    ("B", "Mark it and return later", "return_later"),
+    ("C", "Call out into the dark", "call_dark"),
+)
+
+_CLIMAX_CHOICES: Tuple[Tuple[str, str, str], ...] = (
+    ("A", "Appeal with empathy", "ending_hopeful"),
+    ("B", "Outwit with a bold gambit", "ending_twist"),
+    ("C", "Defy at any cost", "ending_tragic"),
+)
+
+# dataclass(slots=...) only exists on Python 3.10+; older versions fall back to __dict__.
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class StoryNode:
     node_id: str
     text: str
-    choices: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    choices: Tuple[Tuple[str, str, str], ...] = ()
     is_ending: bool = False
-    tags: List[str] = field(default_factory=list)
+    tags: int = 0
+    _wrapped: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class StoryState:
     genre: str
     tone: str
@@ -39,34 +176,29 @@ class StoryGenerator:
     def __init__(self, state: StoryState):
         self.state = state
         self.rand = random.Random(state.world_seed)
+        # Nodes are built lazily in visit order, so make every random pick up front,
+        # in the order the eager build used; the route taken can't change the world.
+        self._world = self._world_description()
+        self._hook = self._inciting_incident()
+        self._clue = self._mysterious_clue()
+        self._ally = self._ally_name()
+        self._terrain_name = self._terrain()
+        self._force = self._antagonistic_force()
 
     def generate_opening(self) -> StoryNode:
-        world = self._world_description()
-        hook = self._inciting_incident()
         text = (
             f"In a {self.state.tone} {self.state.genre} world, {self.state.protagonist} "
-            f"travels with {self.state.companion}. {world} {hook}\n\n"
+            f"travels with {self.state.companion}. {self._world} {self._hook}\n\n"
             "What will you do?"
         )
-        choices = {
-            "A": ("Investigate the omen", "omen"),
-            "B": ("Seek an ally in the nearest settlement", "ally"),
-            "C": ("Ignore it and press onward", "onward"),
-        }
-        return StoryNode("opening", text, choices)
+        return StoryNode("opening", text, _OPENING_CHOICES)
 
     def generate_omen(self) -> StoryNode:
-        clue = self._mysterious_clue()
         text = (
             f"The air shivers as runes flicker across the path. {self.state.companion} "
-            f"whispers about old tales. You notice {clue}.\n\nWill you:"
+            f"whispers about old tales. You notice {self._clue}.\n\nWill you:"
         )
-        choices = {
-            "A": ("Study the runes closely", "study_runes"),
-            "B": ("Mark the site and retreat for now", "retreat"),
-            "C": ("Touch the brightest rune", "touch_rune"),
-        }
-        return StoryNode("omen", text, choices)
+        return StoryNode("omen", text, _OMEN_CHOICES)
 
     def generate_study_runes(self) -> StoryNode:
         text = (
@@ -75,38 +207,21 @@ class StoryGenerator:
             "The markings pulse gently, revealing a hidden direction.\n\n"
             "What will you do next?"
         )
-        choices = {
-            "A": ("Follow the glowing path", "hidden_path"),
-            "B": ("Copy the runes for later study", "onward"),
-            "C": ("Erase one and see what happens", "climax"),
-        }
-        return StoryNode("study_runes", text, choices)
+        return StoryNode("study_runes", text, _STUDY_RUNES_CHOICES)
 
     def generate_ally(self) -> StoryNode:
-        ally_name = self._ally_name()
         text = (
-            f"At the settlement, a wary figure named {ally_name} offers guidance for a price. "
+            f"At the settlement, a wary figure named {self._ally} offers guidance for a price. "
             f"They speak of a hidden way only the persistent may find.\n\nChoose:"
         )
-        choices = {
-            "A": ("Barter a keepsake for their map", "get_map"),
-            "B": ("Earn trust by helping with a local problem", "help_local"),
-            "C": ("Refuse and chart your own route", "onward"),
-        }
-        return StoryNode("ally", text, choices)
+        return StoryNode("ally", text, _ALLY_CHOICES)
 
     def generate_onward(self) -> StoryNode:
-        terrain = self._terrain()
         text = (
-            f"You press onward into {terrain}. The path splits before a stone arch. "
+            f"You press onward into {self._terrain_name}. The path splits before a stone arch. "
             f"Beneath the moss, faint grooves suggest something is missing.\n\nDo you:" 
         )
-        choices = {
-            "A": ("Search the area for a fitting object", "search_area"),
-            "B": ("Force your way through the arch", "force_arch"),
-            "C": ("Set camp and wait for signs", "make_camp"),
-        }
-        return StoryNode("onward", text, choices)
+        return StoryNode("onward", text, _ONWARD_CHOICES)
 
     def generate_hidden_path(self) -> StoryNode:
         text = (
@@ -114,25 +229,14 @@ class StoryGenerator:
             "overlap. Few ever notice this place. A hush falls as if the story itself is "
             "holding its breath.\n\nProceed?"
         )
-        choices = {
-            "A": ("Enter the hidden passage", "hidden_depths"),
-            "B": ("Mark it and return later", "return_later"),
-            "C": ("Call out into the dark", "call_dark"),
-        }
-        return StoryNode("hidden_path", text, choices, tags=["hidden"])
+        return StoryNode("hidden_path", text, _HIDDEN_PATH_CHOICES, tags=TAG_HIDDEN)
 
     def generate_climax(self) -> StoryNode:
-        force = self._antagonistic_force()
         text = (
-            f"At last, you confront {force}. Threads of fate tighten around {self.state.protagonist}.\n"
+            f"At last, you confront {self._force}. Threads of fate tighten around {self.state.protagonist}.\n"
             "The outcome turns on a single choice.\n\nChoose your stand:"
         )
-        choices = {
-            "A": ("Appeal with empathy", "ending_hopeful"),
-            "B": ("Outwit with a bold gambit", "ending_twist"),
-            "C": ("Defy at any cost", "ending_tragic"),
-        }
-        return StoryNode("climax", text, choices)
+        return StoryNode("climax", text, _CLIMAX_CHOICES)
 
     def generate_ending(self, style: str) -> StoryNode:
         base = (
@@ -140,191 +244,177 @@ class StoryGenerator:
             f"face the consequences. {self._ending_fragment(style)}\n\n"
             f"This chapter closes in a {style} way."
         )
-        return StoryNode(f"ending_{style}", base, {}, is_ending=True, tags=["ending", style])
+        return StoryNode(
+            f"ending_{style}", base, (), is_ending=True,
+            tags=TAG_ENDING | _STYLE_TAGS.get(style, 0),
+        )
 
     # --- Internal content helpers ---
     def _world_description(self) -> str:
-        motifs = {
-            "fantasy": [
-                "ancient forests hum with latent magic",
-                "ruins dream beneath ivy and star-shards",
-                "dragons are rumors woven into lullabies",
-            ],
-            "sci-fi": [
-                "neon skylines flicker over rusted megastructures",
-                "fractured moons glow above orbital shipyards",
-                "synthetic dawns reboot forgotten cities",
-            ],
-            "mystery": [
-                "fog erases footprints faster than they form",
-                "clocks tick out-of-sync with the heart",
-                "every window watches with a different story",
-            ],
-        }
-        key = self._closest_key(self.state.genre, motifs)
-        return self.rand.choice(motifs[key]).capitalize() + "."
+        key = self._closest_key(self.state.genre)
+        return self.rand.choice(_MOTIFS[key]).capitalize() + "."
 
     def _inciting_incident(self) -> str:
-        incidents = [
-            "A comet carves a silent arc and leaves a whispering tail.",
-            "A letter arrives signed by a future version of you.",
-            "The river flows backward for exactly one minute.",
-            "A bell rings where there is no bell.",
-        ]
-        return self.rand.choice(incidents)
+        return self.rand.choice(_INCIDENTS)
 
     def _mysterious_clue(self) -> str:
-        clues = [
-            "a rune repeating the shape of your heartbeat",
-            "ash arranged like a compass pointing underground",
-            "a soft tone audible only when eyes are closed",
-            "footprints that avoid every puddle",
-        ]
-        return self.rand.choice(clues)
+        return self.rand.choice(_CLUES)
 
     def _ally_name(self) -> str:
-        first = ["Iria", "Thorne", "Vel", "Mara", "Kade", "Nyx", "Quen"]
-        last = ["Ashfall", "Kestrel", "Voss", "Hallow", "Strand", "Noct"]
-        return f"{self.rand.choice(first)} {self.rand.choice(last)}"
+        r = self.rand
+        return f"{r.choice(_FIRST_NAMES)} {r.choice(_LAST_NAMES)}"
 
     def _terrain(self) -> str:
-        terrains = [
-            "wind-scoured valley",
-            "tangle of luminous reeds",
-            "labyrinth of basalt spires",
-            "glimmering salt flats",
-        ]
-        return self.rand.choice(terrains)
+        return self.rand.choice(_TERRAINS)
 
     def _antagonistic_force(self) -> str:
-        forces = [
-            "the Archivist who edits memories",
-            "the Clock that refuses to strike midnight",
-            "the Leviathan beneath the city",
-            "the Choir of Masks that speaks as one",
-        ]
-        return self.rand.choice(forces)
+        return self.rand.choice(_FORCES)
 
     def _ending_fragment(self, style: str) -> str:
-        if style == "hopeful":
-            return (
-                "Kindness accumulates like dawn. Promises once broken are rewoven, and the "
-                "road ahead gleams with possibility."
-            )
-        if style == "tragic":
-            return (
-                "A necessary loss settles like snow. What is saved endures because of what "
-                "was given up."
-            )
-        return (
-            "Nothing was as it seemed: the question mattered more than the answer, and "
-            "the answer changes when observed."
-        )
+        return _ENDING_FRAGMENTS.get(style, _ENDING_FRAGMENTS["twist"])
 
-    def _closest_key(self, key: str, mapping: Dict[str, List[str]]) -> str:
-        k = key.strip().lower()
-        if k in mapping:
-            return k
-        for candidate in mapping.keys():
-            if candidate.startswith(k[:3]):
-                return candidate
-        return next(iter(mapping.keys()))
+    def _closest_key(self, key: str) -> str:
+        prefix = key.strip().lower()[:3]
+        found = _GENRE_KEYS.get(prefix)
+        if found is None:
+            # Inputs shorter than three letters still match by prefix.
+            found = next((g for g in _MOTIFS if g.startswith(prefix)), "fantasy")
+        return found
 
 
 class StoryEngine:
-    SECRET_INPUT = "whisper"
+    SECRET_INPUT = _SECRET
+
+    # Nodes are generated on first visit; most sessions only see a few of them.
+    _BUILDERS: Dict[str, Callable[[StoryGenerator], StoryNode]] = {
+        "opening": StoryGenerator.generate_opening,
+        "omen": StoryGenerator.generate_omen,
+        "study_runes": StoryGenerator.generate_study_runes,  # ✅ FIX ADDED
+        "ally": StoryGenerator.generate_ally,
+        "onward": StoryGenerator.generate_onward,
+        "hidden_path": StoryGenerator.generate_hidden_path,
+        "climax": StoryGenerator.generate_climax,
+        "ending_hopeful": lambda gen: gen.generate_ending("hopeful"),
+        "ending_tragic": lambda gen: gen.generate_ending("tragic"),
+        "ending_twist": lambda gen: gen.generate_ending("twist"),
+    }
 
     def __init__(self, state: StoryState):
         self.state = state
         self.gen = StoryGenerator(state)
-        self.nodes = self._build_nodes()
+        self._nodes: Dict[str, StoryNode] = {}
         self.current_id = "opening"
 
-    def _build_nodes(self) -> Dict[str, StoryNode]:
-        nodes = {
-            "opening": self.gen.generate_opening(),
-            "omen": self.gen.generate_omen(),
-            "study_runes": self.gen.generate_study_runes(),  # ✅ FIX ADDED
-            "ally": self.gen.generate_ally(),
-            "onward": self.gen.generate_onward(),
-            "hidden_path": self.gen.generate_hidden_path(),
-            "climax": self.gen.generate_climax(),
-            "ending_hopeful": self.gen.generate_ending("hopeful"),
-            "ending_tragic": self.gen.generate_ending("tragic"),
-            "ending_twist": self.gen.generate_ending("twist"),
-        }
-        return nodes
+    def _get(self, node_id: str) -> Optional[StoryNode]:
+        if node_id not in self._BUILDERS:
+            return None
+        return self._node(node_id)
+
+    def _node(self, node_id: str) -> StoryNode:
+        # Raises KeyError for ids with no builder; current_id only ever points at one.
+        node = self._nodes.get(node_id)
+        if node is None:
+            node = self._nodes[node_id] = self._BUILDERS[node_id](self.gen)
+        return node
 
     def restart_with(self, new_state: StoryState) -> None:
         self.state = new_state
         self.gen = StoryGenerator(new_state)
-        self.nodes = self._build_nodes()
+        self._nodes.clear()
         self.current_id = "opening"
 
     def step(self, user_input: str) -> Optional[StoryNode]:
-        user_input = user_input.strip()
-        node = self.nodes[self.current_id]
-
-        if user_input.startswith(":"):
+        if user_input and (user_input[0].isspace() or user_input[-1].isspace()):
+            user_input = user_input.strip()
+        if not user_input:
+            return None
+        get = self._node
+        node = get(self.current_id)
+
+        if user_input[0] == ":":
             self._handle_command(user_input[1:])
-            return self.nodes[self.current_id]
-
-        if user_input.lower() == self.SECRET_INPUT:
-            self.state.flags["secret"] = self.state.flags.get("secret", 0) + 1
+            return get(self.current_id)
+
+        flags = self.state.flags
+        if user_input.lower() == _SECRET:
+            try:
+                flags["secret"] += 1
+            except KeyError:
+                flags["secret"] = 1
             self.current_id = "hidden_path"
-            return self.nodes[self.current_id]
-
-        if node.node_id == "omen" and user_input.upper() == "A":
-            self.state.flags["studies"] = self.state.flags.get("studies", 0) + 1
-            if self.state.flags["studies"] >= 2:
+            return get("hidden_path")
+
+        if len(user_input) == 1:
+            # Single letters are the common case; clearing bit 0x20 uppercases ASCII
+            # and CPython hands back its cached one-character string.
+            choice = chr(ord(user_input) & 0x5F) if "a" <= user_input <= "z" else user_input
+        else:
+            choice = user_input.upper()
+        node_id = node.node_id
+        if node_id == "omen" and choice == "A":
+            try:
+                studies = flags["studies"] + 1
+            except KeyError:
+                studies = 1
+            flags["studies"] = studies
+            if studies >= 2:
                 self.current_id = "hidden_path"
-                return self.nodes[self.current_id]
+                return get("hidden_path")
 
-        if user_input.upper() in node.choices:
-            _, next_id = node.choices[user_input.upper()]
-            self._apply_side_effects(node.node_id, user_input.upper())
+        # Choices are always keyed A, B, C... in order, so the letter is the index.
+        idx = ord(choice) - 65 if len(choice) == 1 else -1
+        if 0 <= idx < len(node.choices):
+            _, _, next_id = node.choices[idx]
+            self._apply_side_effects(node_id, choice)
             self.current_id = next_id
             return self._maybe_funnel_to_climax()
 
         return None
 
     def _maybe_funnel_to_climax(self) -> StoryNode:
-        self.state.flags["steps"] = self.state.flags.get("steps", 0) + 1
-        node = self.nodes.get(self.current_id)
+        flags = self.state.flags
+        try:
+            steps = flags["steps"] + 1
+        except KeyError:
+            steps = 1
+        flags["steps"] = steps
+        node = self._get(self.current_id)
         if node is None:
             # safety fallback
             self.current_id = "climax"
-            return self.nodes["climax"]
+            return self._node("climax")
         if (
             not node.is_ending
-            and "hidden" not in node.tags
-            and self.state.flags.get("steps", 0) >= 4
-            and any(k for k in self.state.flags.keys() if k not in ("steps",))
+            and not node.tags & TAG_HIDDEN
+            and steps >= 4
+            and len(flags) > 1  # "steps" is always set above; any other flag counts
         ):
             self.current_id = "climax"
-            return self.nodes["climax"]
+            return self._node("climax")
         return node
 
     def _apply_side_effects(self, node_id: str, choice: str) -> None:
+        state = self.state
+        flags = state.flags
         if node_id == "ally" and choice == "A":
-            self.state.inventory.append("cryptic map")
-            self.state.flags["map"] = 1
+            state.inventory.append("cryptic map")
+            flags["map"] = 1
         if node_id == "onward" and choice == "A":
-            self.state.inventory.append("stone key")
-            self.state.flags["key"] = 1
+            state.inventory.append("stone key")
+            flags["key"] = 1
         if node_id == "omen" and choice == "C":
-            self.state.flags["reckless"] = 1
+            flags["reckless"] = 1
         if node_id == "onward" and choice == "B":
-            self.state.flags["wounded"] = 1
+            flags["wounded"] = 1
 
     def get_current_node(self) -> StoryNode:
-        return self.nodes[self.current_id]
+        return self._node(self.current_id)
 
     def rewrite_ending(self, style: str) -> None:
         style_key = style.strip().lower()
-        if style_key not in ("hopeful", "tragic", "twist"):
+        if style_key not in _ENDING_STYLES:
             style_key = "twist"
-        self.nodes[f"ending_{style_key}"] = self.gen.generate_ending(style_key)
+        # Endings are deterministic, so reuse the cached node (and its wrapped text).
         self.current_id = f"ending_{style_key}"
 
     def _handle_command(self, cmd: str) -> None:
@@ -356,6 +446,11 @@ class StoryEngine:
             raise SystemExit(0)
 
 
+_PROMPT_MSG = wrap("(Type A/B/C to choose, or commands like :help, :state, :inv, :rewrite)")
+_HINT_MSG = wrap(f"Hint: type '{StoryEngine.SECRET_INPUT}' at any time to seek hidden paths.")
+_FOOTER = f"\n{_PROMPT_MSG}\n{_HINT_MSG}\n"
+
+
 def prompt_for_seeds() -> StoryState:
     print(wrap("Let's set up your story world. Leave blank for defaults."))
     genre = input("Genre (fantasy/sci-fi/mystery): ").strip() or "fantasy"
@@ -363,7 +458,8 @@ def prompt_for_seeds() -> StoryState:
     protagonist = input("Protagonist name: ").strip() or "Ari"
     companion = input("Companion name: ").strip() or "Rook"
     seed_str = f"{genre}|{tone}|{protagonist}|{companion}"
-    world_seed = abs(hash(seed_str)) % (2**31 - 1)
+    # crc32 is stable across runs, unlike str hash() under PYTHONHASHSEED.
+    world_seed = zlib.crc32(seed_str.encode("utf-8")) & 0x7FFFFFFF
     return StoryState(
         genre=genre,
         tone=tone,
@@ -374,15 +470,14 @@ def prompt_for_seeds() -> StoryState:
 
 
 def print_node(node: StoryNode) -> None:
-    print()
-    print(wrap(node.text))
+    if node._wrapped is None:
+        node._wrapped = wrap(node.text)
+    parts = ["\n", node._wrapped, "\n"]
     if node.choices:
-        print()
-        for key, (label, _) in node.choices.items():
-            print(f"  {key}. {label}")
-    print()
-    print(wrap("(Type A/B/C to choose, or commands like :help, :state, :inv, :rewrite)"))
-    print(wrap(f"Hint: type '{StoryEngine.SECRET_INPUT}' at any time to seek hidden paths."))
+        parts.append("\n")
+        parts.extend(f"  {key}. {label}\n" for key, label, _ in node.choices)
+    parts.append(_FOOTER)
+    sys.stdout.write("".join(parts))
 
 
 def main() -> None:
@@ -406,8 +501,7 @@ def main() -> None:
                 except SystemExit:
                     break
             else:
-                styles = ["hopeful", "twist", "tragic"]
-                style = styles[random.randint(0, 2)]
+                style = random.choice(_ENDING_STYLES)
                 engine.rewrite_ending(style)
             continue
 